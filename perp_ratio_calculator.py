@@ -3,17 +3,47 @@
 import ccxt
 from utils import bn_api_key, bn_api_secret, bb_api_key, bb_api_secret, bg_api_key, bg_api_secret, bg_passphrase, TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID
 from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+from datetime import datetime, timedelta
 import argparse
+import atexit
+import json
+import sys
 import time
-import schedule
 import requests
+
+try:
+    # ccxt parses every response through json.loads; orjson is 2-5x faster
+    # on the float-heavy payloads fetch_positions/fetch_balance return.
+    # Patch it in before any exchange client is built.
+    import orjson
+    json.loads = orjson.loads
+except ImportError:
+    pass
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Single worker keeps Telegram messages ordered and naturally rate-limited
+# while taking the HTTP round-trip (and any 429 retry sleep) off the hot path
+_tg_executor = ThreadPoolExecutor(max_workers=1)
+atexit.register(_tg_executor.shutdown, wait=True)
+
+# Reuse one session so the TLS connection to api.telegram.org is kept
+# alive across sends instead of paying a fresh handshake per message
+_TG_SESSION = requests.Session()
+_TG_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+))
+
 def log_api_response(response, description):
-    logger.info(f"{description}: {response}")
+    logger.info("%s: %s", description, response)
 
 def send_telegram_message(message):
     try:
@@ -23,60 +53,97 @@ def send_telegram_message(message):
             "text": message,
             "parse_mode": "Markdown"
         }
-        response = requests.post(url, data=payload, timeout=10)
+        response = _TG_SESSION.post(url, data=payload, timeout=10)
         response.raise_for_status()
-        response_json = response.json()
+        response_json = json.loads(response.content)
         
         log_api_response(response_json, "Telegram API Response")
         
         if not response_json.get("ok"):
             logger.error(
-                f"Telegram API Error: {response_json.get('description')} (Error Code: {response_json.get('error_code')}) for message: {message[:100]}...")
+                "Telegram API Error: %s (Error Code: %s) for message: %.100s...",
+                response_json.get('description'), response_json.get('error_code'), message)
             if response_json.get('error_code') == 429:
                 retry_after = response_json.get('parameters', {}).get('retry_after')
                 if retry_after and isinstance(retry_after, int) and retry_after > 0:
-                    logger.warning(f"Telegram rate limit hit. Retrying after {retry_after} seconds.")
+                    logger.warning("Telegram rate limit hit. Retrying after %s seconds.", retry_after)
                     time.sleep(retry_after)
-                    response_retry = requests.post(url, data=payload, timeout=10)
+                    response_retry = _TG_SESSION.post(url, data=payload, timeout=10)
                     response_retry.raise_for_status()
-                    response_retry_json = response_retry.json()
+                    response_retry_json = json.loads(response_retry.content)
                     log_api_response(response_retry_json, "Telegram API Retry Response")
                     if response_retry_json.get("ok"):
-                        logger.info(f"Message sent to Telegram successfully after retry: {message[:100]}...")
+                        logger.info("Message sent to Telegram successfully after retry: %.100s...", message)
                     else:
-                        logger.error(f"Telegram API Error on retry: {response_retry_json.get('description')}")
+                        logger.error("Telegram API Error on retry: %s", response_retry_json.get('description'))
                 else:
                     logger.warning("Telegram rate limit hit, but no valid retry_after. Not retrying immediately.")
         else:
-            logger.info(f"Message sent to Telegram successfully: {message[:100]}...")
+            logger.info("Message sent to Telegram successfully: %.100s...", message)
     except requests.exceptions.HTTPError as he:
-        logger.error(f"HTTP Error when sending Telegram message: {he.response.status_code} - {he.response.text}")
+        logger.error("HTTP Error when sending Telegram message: %s - %s", he.response.status_code, he.response.text)
     except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to send Telegram message due to RequestException: {e}")
+        logger.error("Failed to send Telegram message due to RequestException: %s", e)
     except Exception as e:
-        logger.error(f"An unexpected error occurred in send_telegram_message: {e}", exc_info=True)
+        logger.error("An unexpected error occurred in send_telegram_message: %s", e, exc_info=True)
+
+# Cache ccxt clients (and their loaded markets) across runs so the daemon
+# doesn't re-fetch exchange metadata every hour; refreshed daily since
+# exchange info changes rarely
+_EXCHANGE_CACHE: Dict[str, Tuple[float, 'ccxt.Exchange']] = {}
+_EXCHANGE_CACHE_TTL = 86400
 
 class PerpRatioCalculator:
     # Exchange alias mapping
     EXCHANGE_ALIASES = {
         'bn': 'binance',
-        'bb': 'bybit', 
+        'bb': 'bybit',
         'bg': 'bitget'
     }
-    
-    def __init__(self, exchange_name: str):
+
+    # Tickers excluded from the ratio calculation, in every symbol format
+    # the supported exchanges return
+    _EXCLUDED_TICKERS = frozenset({
+        'PAXGUSDT', 'BTCDOMUSDT',
+        'PAXG/USDT', 'BTCDOM/USDT',
+        'PAXG/USDT:USDT', 'BTCDOM/USDT:USDT'
+    })
+
+    # Per-exchange (timestamp, balance) cache shared by all instances;
+    # balances only move on fills, so a short TTL is safe for reporting
+    _balance_cache: Dict[str, Tuple[float, Dict]] = {}
+
+    def __init__(self, exchange_name: str, balance_ttl: int = 300):
         # Handle aliases
         self.exchange_name = self.EXCHANGE_ALIASES.get(exchange_name.lower(), exchange_name.lower())
-        self.exchange = self._initialize_exchange()
+        self.balance_ttl = balance_ttl
+        self.exchange = self._get_cached_exchange()
+
+    def _get_cached_exchange(self):
+        cached_ts, cached = _EXCHANGE_CACHE.get(self.exchange_name, (0, None))
+        if cached is not None and time.time() - cached_ts < _EXCHANGE_CACHE_TTL:
+            return cached
+
+        exchange = self._initialize_exchange()
+        exchange.options['warnOnFetchOpenOrdersWithoutSymbol'] = False
+        # Widen the client's urllib3 pool so the concurrent positions and
+        # balance fetches reuse keep-alive connections instead of opening
+        # a second TLS session, and retry transient gateway errors
+        exchange.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.25, status_forcelist=[502, 503, 504])
+        ))
+        # Load markets eagerly so the first data call of each run doesn't
+        # pay the implicit exchange-info fetch
+        exchange.load_markets()
+        _EXCHANGE_CACHE[self.exchange_name] = (time.time(), exchange)
+        return exchange
     
     def _clean_symbol(self, symbol: str) -> str:
-        """Clean symbol name by removing redundant USDT/USDC suffixes"""
-        # Remove :USDT or :USDC suffix if present
-        if ':USDT' in symbol:
-            symbol = symbol.split(':USDT')[0]
-        elif ':USDC' in symbol:
-            symbol = symbol.split(':USDC')[0]
-        return symbol
+        """Clean symbol name by removing the redundant settlement suffix (e.g. :USDT)"""
+        head, sep, _ = symbol.partition(':')
+        return head if sep else symbol
         
     def _initialize_exchange(self):
         if self.exchange_name == 'binance':
@@ -115,21 +182,39 @@ class PerpRatioCalculator:
     
     def fetch_positions(self) -> List[Dict]:
         try:
+            # Drop zero-contract rows and excluded tickers at ingest so no
+            # downstream pass has to walk or re-filter them
             positions = self.exchange.fetch_positions()
-            return [pos for pos in positions if pos['contracts'] > 0]
+            return [pos for pos in positions
+                    if pos.get('contracts') and pos['contracts'] > 0
+                    and pos['symbol'] not in self._EXCLUDED_TICKERS]
         except Exception as e:
             print(f"Error fetching positions: {e}")
             return []
     
     def fetch_account_balance(self) -> Dict:
+        if self.balance_ttl > 0:
+            cached_ts, cached = self._balance_cache.get(self.exchange_name, (0, None))
+            if cached is not None and time.time() - cached_ts < self.balance_ttl:
+                logger.info("Using cached account balance for %s", self.exchange_name)
+                return cached
+
+        result = self._fetch_account_balance()
+        # Only cache real data - the error fallback is all zeros
+        if result['total_wallet_balance'] or result['total_margin_balance']:
+            self._balance_cache[self.exchange_name] = (time.time(), result)
+        return result
+
+    def _fetch_account_balance(self) -> Dict:
         try:
             balance = self.exchange.fetch_balance()
             # Get the total account value for futures trading
             if self.exchange_name == 'binance':
                 # For Binance, we need the futures account balance
-                total_wallet_balance = balance.get('info', {}).get('totalWalletBalance', 0)
-                total_unrealized_pnl = balance.get('info', {}).get('totalUnrealizedProfit', 0)
-                total_margin_balance = balance.get('info', {}).get('totalMarginBalance', 0)
+                info = balance.get('info') or {}
+                total_wallet_balance = info.get('totalWalletBalance', 0)
+                total_unrealized_pnl = info.get('totalUnrealizedProfit', 0)
+                total_margin_balance = info.get('totalMarginBalance', 0)
                 
                 return {
                     'total_wallet_balance': float(total_wallet_balance) if total_wallet_balance else 0,
@@ -137,10 +222,13 @@ class PerpRatioCalculator:
                     'total_margin_balance': float(total_margin_balance) if total_margin_balance else 0
                 }
             elif self.exchange_name == 'bybit':
-                # For Bybit, we need the unified account balance
-                total_equity = balance.get('info', {}).get('result', {}).get('list', [{}])[0].get('totalEquity', 0)
-                total_wallet_balance = balance.get('info', {}).get('result', {}).get('list', [{}])[0].get('totalWalletBalance', 0)
-                total_unrealized_pnl = balance.get('info', {}).get('result', {}).get('list', [{}])[0].get('totalPerpUPL', 0)
+                # For Bybit, we need the unified account balance; walk the
+                # nested response once instead of per field
+                account_list = (balance.get('info') or {}).get('result', {}).get('list') or [{}]
+                account = account_list[0]
+                total_equity = account.get('totalEquity', 0)
+                total_wallet_balance = account.get('totalWalletBalance', 0)
+                total_unrealized_pnl = account.get('totalPerpUPL', 0)
                 
                 return {
                     'total_wallet_balance': float(total_wallet_balance) if total_wallet_balance else 0,
@@ -168,8 +256,8 @@ class PerpRatioCalculator:
                                     'total_unrealized_pnl': total_unrealized_pnl,
                                     'total_margin_balance': total_margin_balance
                                 }
-                except:
-                    pass
+                except (KeyError, IndexError, TypeError, ValueError) as e:
+                    logger.warning("Failed to parse bitget balance response: %s", e)
                 return {'total_wallet_balance': 0, 'total_unrealized_pnl': 0, 'total_margin_balance': 0}
             else:
                 return {'total_wallet_balance': 0, 'total_unrealized_pnl': 0, 'total_margin_balance': 0}
@@ -178,24 +266,22 @@ class PerpRatioCalculator:
             return {'total_wallet_balance': 0, 'total_unrealized_pnl': 0, 'total_margin_balance': 0}
     
     def calculate_long_short_ratio(self, positions: List[Dict]) -> Dict:
-        excluded_tickers = {'PAXGUSDT', 'BTCDOMUSDT', 'PAXG/USDT', 'BTCDOM/USDT', 'PAXG/USDT:USDT', 'BTCDOM/USDT:USDT'}
-        
         # Group positions by symbol and net them
         symbol_positions = {}
         symbol_pnl = {}
         
+        # Excluded tickers are already filtered out by fetch_positions
         for pos in positions:
             symbol = pos['symbol']
-            if symbol in excluded_tickers:
-                continue
-                
             notional = pos['notional']
             if notional is None:
                 continue
-                
+            # Some ccxt parsers hand these back as strings; normalize to
+            # float once so the arithmetic below stays on the fast path
+            notional = float(notional)
+
             side = pos['side']
-            # Get unrealized PNL
-            unrealized_pnl = pos.get('unrealizedPnl', 0) or 0
+            unrealized_pnl = float(pos.get('unrealizedPnl') or 0.0)
             
             # For Bybit, adjust notional value with unrealized PNL
             if self.exchange_name == 'bybit':
@@ -223,28 +309,42 @@ class PerpRatioCalculator:
             symbol_positions[symbol] += notional_value
             symbol_pnl[symbol] += unrealized_pnl
         
-        # Calculate raw long/short totals
+        # Materialize the netted positions as flat rows once, so the
+        # reduction below reads precomputed fields instead of re-running
+        # dict lookups and startswith per pass
+        rows = [(symbol, net, symbol_pnl[symbol], symbol.startswith('BTC'))
+                for symbol, net in symbol_positions.items()]
+
+        # Single pass over the rows: raw totals, BTC-weighted effective
+        # totals, and the long/short buckets the report printers consume
         raw_long_total = 0
         raw_short_total = 0
-        
-        for symbol, net_notional in symbol_positions.items():
-            if net_notional > 0:
-                raw_long_total += net_notional
-            elif net_notional < 0:
-                raw_short_total += abs(net_notional)
-        
-        # Calculate effective long/short totals with BTC weighting
         effective_long_total = 0
         effective_short_total = 0
-        
-        for symbol, net_notional in symbol_positions.items():
-            weight = 0.5 if symbol.startswith('BTC') else 1.0
-            
+        long_entries = []
+        short_entries = []
+        symbol_clean = {}
+
+        for symbol, net_notional, pnl, is_btc in rows:
+            weight = 0.5 if is_btc else 1.0
+            symbol_clean[symbol] = self._clean_symbol(symbol)
+
             if net_notional > 0:
+                raw_long_total += net_notional
                 effective_long_total += net_notional * weight
+                long_entries.append((symbol, net_notional, pnl))
             elif net_notional < 0:
-                effective_short_total += abs(net_notional) * weight
-        
+                abs_notional = -net_notional
+                raw_short_total += abs_notional
+                effective_short_total += abs_notional * weight
+                short_entries.append((symbol, net_notional, pnl))
+
+        # Sort once here so both report paths reuse the same ordering:
+        # long descending by notional; short nets are negative, so plain
+        # ascending order is descending absolute value without per-key abs()
+        long_entries.sort(key=itemgetter(1), reverse=True)
+        short_entries.sort(key=itemgetter(1))
+
         # Calculate ratio
         if effective_short_total > 0:
             ratio = effective_long_total / effective_short_total
@@ -262,21 +362,31 @@ class PerpRatioCalculator:
             'long_short_ratio': ratio,
             'symbol_positions': symbol_positions,
             'symbol_pnl': symbol_pnl,
+            'long_entries': long_entries,
+            'short_entries': short_entries,
+            'symbol_clean': symbol_clean,
             'overall_pnl': overall_pnl
         }
     
     def run(self):
-        logger.info(f"Fetching positions from {self.exchange_name}...")
-        positions = self.fetch_positions()
-        
-        logger.info(f"Fetching account balance from {self.exchange_name}...")
-        account_balance = self.fetch_account_balance()
+        # Re-resolve the client so a long-lived calculator still picks up
+        # the daily exchange-cache refresh
+        self.exchange = self._get_cached_exchange()
+
+        # Positions and balance are independent calls, so fetch them
+        # concurrently to overlap the two HTTP round-trips
+        logger.info("Fetching positions and account balance from %s...", self.exchange_name)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            positions_future = executor.submit(self.fetch_positions)
+            balance_future = executor.submit(self.fetch_account_balance)
+            positions = positions_future.result()
+            account_balance = balance_future.result()
         
         if not positions:
             logger.info("No positions found.")
             return None
         
-        logger.info(f"Found {len(positions)} positions")
+        logger.info("Found %d positions", len(positions))
         
         results = self.calculate_long_short_ratio(positions)
         results['account_balance'] = account_balance
@@ -288,85 +398,80 @@ class PerpRatioCalculator:
         RED = '\033[91m'
         RESET = '\033[0m'
         
-        print("\n" + "="*60)
-        print("PERPETUAL POSITIONS LONG/SHORT RATIO ANALYSIS")
-        print("="*60)
-        print(f"Exchange: {self.exchange_name.upper()}")
-        print(f"Total positions analyzed: {len(positions)}")
-        print(f"Excluded tickers: PAXGUSDT, BTCDOMUSDT")
-        print(f"BTC weight factor: 0.5")
-        
-        print("\n" + "-"*40)
-        print("ACCOUNT BALANCE")
-        print("-"*40)
-        print(f"Wallet Balance:        ${results['account_balance']['total_wallet_balance']:,.2f}")
-        print(f"{CYAN}Margin Balance:        ${results['account_balance']['total_margin_balance']:,.2f}{RESET}")
-        
+        # Build the whole report in memory and write it with a single
+        # stdout call instead of dozens of individual print()s
+        lines = []
+        lines.append("\n" + "="*60)
+        lines.append("PERPETUAL POSITIONS LONG/SHORT RATIO ANALYSIS")
+        lines.append("="*60)
+        lines.append(f"Exchange: {self.exchange_name.upper()}")
+        lines.append(f"Total positions analyzed: {len(positions)}")
+        lines.append(f"Excluded tickers: PAXGUSDT, BTCDOMUSDT")
+        lines.append(f"BTC weight factor: 0.5")
+
+        lines.append("\n" + "-"*40)
+        lines.append("ACCOUNT BALANCE")
+        lines.append("-"*40)
+        lines.append(f"Wallet Balance:        ${results['account_balance']['total_wallet_balance']:,.2f}")
+        lines.append(f"{CYAN}Margin Balance:        ${results['account_balance']['total_margin_balance']:,.2f}{RESET}")
+
         # Color PNL based on positive/negative
         pnl_value = results['account_balance']['total_unrealized_pnl']
         pnl_color = GREEN if pnl_value >= 0 else RED
-        print(f"{pnl_color}Unrealized PNL:        ${pnl_value:,.2f}{RESET}")
-        
-        print("\n" + "-"*40)
-        print("OVERALL NOTIONAL VALUES")
-        print("-"*40)
-        print(f"Raw Long Total:        ${results['raw_long_total']:,.2f}")
-        print(f"Raw Short Total:       ${results['raw_short_total']:,.2f}")
-        print(f"Effective Long Total:  ${results['effective_long_total']:,.2f}")
-        print(f"Effective Short Total: ${results['effective_short_total']:,.2f}")
-        
+        lines.append(f"{pnl_color}Unrealized PNL:        ${pnl_value:,.2f}{RESET}")
+
+        lines.append("\n" + "-"*40)
+        lines.append("OVERALL NOTIONAL VALUES")
+        lines.append("-"*40)
+        lines.append(f"Raw Long Total:        ${results['raw_long_total']:,.2f}")
+        lines.append(f"Raw Short Total:       ${results['raw_short_total']:,.2f}")
+        lines.append(f"Effective Long Total:  ${results['effective_long_total']:,.2f}")
+        lines.append(f"Effective Short Total: ${results['effective_short_total']:,.2f}")
+
         # Color overall PNL based on positive/negative
         overall_pnl = results['overall_pnl']
         overall_pnl_color = GREEN if overall_pnl >= 0 else RED
-        print(f"{overall_pnl_color}Overall PNL:           ${overall_pnl:,.2f}{RESET}")
-        
-        print("\n" + "-"*40)
-        print("LONG/SHORT RATIO")
-        print("-"*40)
+        lines.append(f"{overall_pnl_color}Overall PNL:           ${overall_pnl:,.2f}{RESET}")
+
+        lines.append("\n" + "-"*40)
+        lines.append("LONG/SHORT RATIO")
+        lines.append("-"*40)
         if results['long_short_ratio'] == float('inf'):
-            print(f"{YELLOW}Long/Short Ratio: ∞ (no short positions){RESET}")
+            lines.append(f"{YELLOW}Long/Short Ratio: ∞ (no short positions){RESET}")
         else:
-            print(f"{YELLOW}Long/Short Ratio: {results['long_short_ratio']:.4f}{RESET}")
-        
-        print("\n" + "-"*40)
-        print("POSITION BREAKDOWN BY SYMBOL")
-        print("-"*40)
-        
-        # Sort positions: long first, then short, sorted by notional
-        long_positions = []
-        short_positions = []
-        
-        for symbol, net_notional in results['symbol_positions'].items():
-            pnl = results['symbol_pnl'].get(symbol, 0)
-            if net_notional > 0:
-                long_positions.append((symbol, net_notional, pnl))
-            else:
-                short_positions.append((symbol, net_notional, pnl))
-        
-        # Sort by notional value (descending for long, ascending for short)
-        long_positions.sort(key=lambda x: x[1], reverse=True)
-        short_positions.sort(key=lambda x: abs(x[1]), reverse=True)
-        
-        # Print long positions first
+            lines.append(f"{YELLOW}Long/Short Ratio: {results['long_short_ratio']:.4f}{RESET}")
+
+        lines.append("\n" + "-"*40)
+        lines.append("POSITION BREAKDOWN BY SYMBOL")
+        lines.append("-"*40)
+
+        # Pre-sorted by calculate_long_short_ratio: long first, then short,
+        # by descending absolute notional value
+        long_positions = results['long_entries']
+        short_positions = results['short_entries']
+
+        # Long positions first
         if long_positions:
-            print("LONG POSITIONS:")
+            lines.append("LONG POSITIONS:")
             for symbol, net_notional, pnl in long_positions:
-                clean_symbol = self._clean_symbol(symbol)
+                clean_symbol = results['symbol_clean'][symbol]
                 pnl_color = GREEN if pnl >= 0 else RED
                 pnl_str = f" | PNL: {pnl_color}${pnl:>9,.2f}{RESET}"
-                print(f"  {clean_symbol:<15} LONG  ${abs(net_notional):>12,.2f}{pnl_str}")
-        
-        # Print short positions second
+                lines.append(f"  {clean_symbol:<15} LONG  ${abs(net_notional):>12,.2f}{pnl_str}")
+
+        # Short positions second
         if short_positions:
             if long_positions:
-                print()
-            print("SHORT POSITIONS:")
+                lines.append("")
+            lines.append("SHORT POSITIONS:")
             for symbol, net_notional, pnl in short_positions:
-                clean_symbol = self._clean_symbol(symbol)
+                clean_symbol = results['symbol_clean'][symbol]
                 pnl_color = GREEN if pnl >= 0 else RED
                 pnl_str = f" | PNL: {pnl_color}${pnl:>9,.2f}{RESET}"
-                print(f"  {clean_symbol:<15} SHORT ${abs(net_notional):>12,.2f}{pnl_str}")
-        
+                lines.append(f"  {clean_symbol:<15} SHORT ${abs(net_notional):>12,.2f}{pnl_str}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+
         return results
     
     def format_telegram_message(self, results: Dict) -> str:
@@ -392,26 +497,16 @@ class PerpRatioCalculator:
         else:
             message += f"*Long/Short Ratio: {results['long_short_ratio']:.4f}*\n\n"
         
-        # Sort positions: long first, then short, sorted by notional
-        long_positions = []
-        short_positions = []
-        
-        for symbol, net_notional in results['symbol_positions'].items():
-            pnl = results['symbol_pnl'].get(symbol, 0)
-            if net_notional > 0:
-                long_positions.append((symbol, net_notional, pnl))
-            else:
-                short_positions.append((symbol, net_notional, pnl))
-        
-        # Sort by notional value (descending for long, ascending for short)
-        long_positions.sort(key=lambda x: x[1], reverse=True)
-        short_positions.sort(key=lambda x: abs(x[1]), reverse=True)
+        # Pre-sorted by calculate_long_short_ratio: long first, then short,
+        # by descending absolute notional value
+        long_positions = results['long_entries']
+        short_positions = results['short_entries']
         
         # Add long positions
         if long_positions:
             message += "*Long Positions:*\n"
             for symbol, notional, pnl in long_positions:
-                clean_symbol = self._clean_symbol(symbol)
+                clean_symbol = results['symbol_clean'][symbol]
                 message += f"`{clean_symbol:<12}` ${notional:>10,.2f} | PNL: ${pnl:>8,.2f}\n"
             message += "\n"
         
@@ -419,38 +514,59 @@ class PerpRatioCalculator:
         if short_positions:
             message += "*Short Positions:*\n"
             for symbol, notional, pnl in short_positions:
-                clean_symbol = self._clean_symbol(symbol)
+                clean_symbol = results['symbol_clean'][symbol]
                 message += f"`{clean_symbol:<12}` ${abs(notional):>10,.2f} | PNL: ${pnl:>8,.2f}\n"
         
         return message
 
-def run_both_exchanges():
+# Long-lived calculators for the daemon: built lazily on first use and
+# reused every tick instead of reconstructing per scheduled run
+_CALCULATORS: Dict[str, PerpRatioCalculator] = {}
+
+def _get_calculator(exchange, balance_ttl=300):
+    calculator = _CALCULATORS.get(exchange)
+    if calculator is None:
+        calculator = PerpRatioCalculator(exchange, balance_ttl=balance_ttl)
+        _CALCULATORS[exchange] = calculator
+    else:
+        calculator.balance_ttl = balance_ttl
+    return calculator
+
+def _analyze_one_exchange(exchange, balance_ttl=300):
+    try:
+        calculator = _get_calculator(exchange, balance_ttl=balance_ttl)
+        results = calculator.run()
+
+        if results:
+            telegram_message = calculator.format_telegram_message(results)
+            _tg_executor.submit(send_telegram_message, telegram_message)
+            logger.info("Successfully analyzed and queued report for %s", exchange)
+        else:
+            logger.warning("No results from %s", exchange)
+
+    except Exception as e:
+        logger.error("Error analyzing %s: %s", exchange, e, exc_info=True)
+        error_message = f"*{exchange.upper()} - Error*\n\nFailed to fetch positions: {str(e)}"
+        _tg_executor.submit(send_telegram_message, error_message)
+        logger.info("Queued error report for %s", exchange)
+
+def run_both_exchanges(balance_ttl=300):
     logger.info("Starting hourly analysis for all exchanges...")
-    
+
     exchanges = ['binance', 'bybit', 'bitget']
-    
-    for i, exchange in enumerate(exchanges):
-        try:
-            calculator = PerpRatioCalculator(exchange)
-            results = calculator.run()
-            
-            if results:
-                telegram_message = calculator.format_telegram_message(results)
-                send_telegram_message(telegram_message)
-                logger.info(f"Successfully analyzed and sent report for {exchange}")
-            else:
-                logger.warning(f"No results from {exchange}")
-                
-        except Exception as e:
-            logger.error(f"Error analyzing {exchange}: {e}", exc_info=True)
-            error_message = f"*{exchange.upper()} - Error*\n\nFailed to fetch positions: {str(e)}"
-            send_telegram_message(error_message)
-            logger.info(f"Sent error report for {exchange}")
-        
-        # Add delay between exchanges to avoid rate limiting issues
-        if i < len(exchanges) - 1:
-            logger.info("Waiting 5 seconds before processing next exchange...")
-            time.sleep(5)
+
+    # Each exchange is independent I/O with its own rate limiter, so run
+    # them concurrently instead of serially with delays in between
+    with ThreadPoolExecutor(max_workers=len(exchanges)) as executor:
+        futures = {executor.submit(_analyze_one_exchange, exchange, balance_ttl): exchange
+                   for exchange in exchanges}
+        for future in as_completed(futures):
+            exchange = futures[future]
+            try:
+                future.result()
+                logger.info("Finished processing %s", exchange)
+            except Exception as e:
+                logger.error("Unexpected error processing %s: %s", exchange, e, exc_info=True)
 
 def main():
     parser = argparse.ArgumentParser(description='Calculate long/short ratio for perpetual positions')
@@ -458,26 +574,31 @@ def main():
                        help='Exchange to fetch positions from. Aliases: bn=binance, bb=bybit, bg=bitget (default: binance)')
     parser.add_argument('--daemon', action='store_true',
                        help='Run continuously and send hourly reports to Telegram')
-    
+    parser.add_argument('--balance-ttl', type=int, default=300,
+                       help='Seconds to cache account balance between fetches; 0 disables caching (default: 300)')
+
     args = parser.parse_args()
     
     if args.daemon:
         logger.info("Starting daemon mode - will run analysis at the top of each hour and send to Telegram")
-        
-        # Schedule to run at the top of every hour (at minute 0)
-        schedule.every().hour.at(":00").do(run_both_exchanges)
-        
-        logger.info("Scheduler started. Will run at the top of each hour. Press Ctrl+C to stop.")
-        
+        logger.info("Will run at the top of each hour. Press Ctrl+C to stop.")
+
         try:
             while True:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
+                # Sleep straight through to the next top of the hour instead
+                # of waking every minute to poll; recomputing from the wall
+                # clock each cycle keeps us aligned across DST and clock skew
+                now = datetime.now()
+                next_hour = (now + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
+                sleep_seconds = (next_hour - now).total_seconds()
+                logger.info("Sleeping %.0fs until next run at %s", sleep_seconds, next_hour)
+                time.sleep(sleep_seconds)
+                run_both_exchanges(balance_ttl=args.balance_ttl)
         except KeyboardInterrupt:
             logger.info("Daemon stopped by user")
     else:
         try:
-            calculator = PerpRatioCalculator(args.exchange)
+            calculator = PerpRatioCalculator(args.exchange, balance_ttl=args.balance_ttl)
             calculator.run()
         except Exception as e:
             print(f"Error: {e}")